@@ -13,13 +13,15 @@ URIs for YOLO files:
 - Names: https://raw.githubusercontent.com/pjreddie/darknet/master/data/coco.names
 """
 
+# Only what the "every file is already present" path needs is imported here;
+# networking, hashing and subprocess modules are imported where they are used
+import os
 import sys
-import ssl
-import urllib.request
-import urllib.error
-import hashlib
+import time
 import argparse
+import threading
 from pathlib import Path
+from urllib.parse import urlparse
 
 
 # Define URIs for YOLO files
@@ -31,7 +33,10 @@ YOLO_FILES = {
     },
     "yolov3.weights": {
         "url": "https://github.com/patrick013/Object-Detection---Yolov3/raw/master/model/yolov3.weights",
-        "sha256": "523e4e69e1d015393a1b0a441cef1d9c7659e3eb2d7e15f793f060a21b32f297"
+        "sha256": "523e4e69e1d015393a1b0a441cef1d9c7659e3eb2d7e15f793f060a21b32f297",
+        # Large enough (~240 MB) to be worth aria2c's parallel connections;
+        # small files are quicker over the pool's keep-alive connection
+        "external": True
     },
     "coco.names": {
         "url": "https://raw.githubusercontent.com/pjreddie/darknet/master/data/coco.names",
@@ -42,92 +47,590 @@ YOLO_FILES = {
 # Directory where YOLO files will be stored
 YOLO_DIR = Path("data/yolo")
 
+# Upper bound on concurrent downloads (and pooled connections per host),
+# so thread count stays fixed however many files are listed above
+MAX_DOWNLOAD_WORKERS = 4
+
+# Files at least this big are worth hashing in a separate process
+PARALLEL_VERIFY_MIN_SIZE = 64 << 20
+
+# Peer address that last connected successfully, per (host, port)
+_resolved_addresses = {}
+
+
+class _CachedDNSMixin:
+    """Connection mixin that resolves each host only once per run.
+    
+    The first connection to a host goes through the normal resolver; the
+    address it ends up connected to is remembered and used for every later
+    connection (other files, redirects, retries). TLS still uses the real
+    hostname for SNI and certificate checks, since only the socket target
+    changes.
+    """
+    
+    def _new_conn(self):
+        import urllib3
+        
+        key = (self._dns_host, self.port)
+        address = _resolved_addresses.get(key)
+        if address is not None:
+            hostname = self._dns_host
+            self._dns_host = address
+            try:
+                return super()._new_conn()
+            except urllib3.exceptions.ConnectTimeoutError:  # Includes NewConnectionError
+                _resolved_addresses.pop(key, None)  # Stale; resolve again below
+            finally:
+                self._dns_host = hostname
+        
+        sock = super()._new_conn()
+        _resolved_addresses[key] = sock.getpeername()[0]
+        return sock
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def _get_pool():
+    """Return the shared connection pool, creating it on first use.
+    
+    The pool lets downloads reuse keep-alive connections instead of paying a
+    fresh TCP + TLS handshake per file (two of the files live on
+    raw.githubusercontent.com). PoolManager is thread-safe.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            import ssl
+            import urllib3
+            from urllib3.connection import HTTPConnection, HTTPSConnection
+            from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+            
+            class CachedDNSHTTPConnection(_CachedDNSMixin, HTTPConnection):
+                pass
+            
+            class CachedDNSHTTPSConnection(_CachedDNSMixin, HTTPSConnection):
+                pass
+            
+            class CachedDNSHTTPConnectionPool(HTTPConnectionPool):
+                ConnectionCls = CachedDNSHTTPConnection
+            
+            class CachedDNSHTTPSConnectionPool(HTTPSConnectionPool):
+                ConnectionCls = CachedDNSHTTPSConnection
+            
+            class CancellableRetry(urllib3.Retry):
+                def increment(self, *args, **kwargs):
+                    # Give up instead of retrying once the user has pressed Ctrl-C
+                    _check_cancelled()
+                    return super().increment(*args, **kwargs)
+            
+            _pool = urllib3.PoolManager(
+                num_pools=4,
+                maxsize=MAX_DOWNLOAD_WORKERS,
+                retries=CancellableRetry(connect=3, read=3, redirect=5, backoff_factor=0.5),
+                ssl_context=ssl.create_default_context(),
+            )
+            _pool.pool_classes_by_scheme = {
+                "http": CachedDNSHTTPConnectionPool,
+                "https": CachedDNSHTTPSConnectionPool,
+            }
+    return _pool
+
+
+# Minimum number of seconds between redraws of the progress line
+PROGRESS_INTERVAL = 0.25
+
+# Serializes console output from the concurrent download threads
+_print_lock = threading.Lock()
+
+# Set on Ctrl-C; download threads cannot be interrupted directly, so they
+# check this before each request, retry and re-hash, and between blocks
+_cancel = threading.Event()
+
+
+class DownloadCancelled(Exception):
+    """Raised inside a download thread once the user has interrupted the script."""
+
+
+def _check_cancelled():
+    """Raise DownloadCancelled if the user has interrupted the script."""
+    if _cancel.is_set():
+        raise DownloadCancelled()
+
+
+class ProgressMeter:
+    """Combined progress line for all running downloads.
+    
+    The percentage scale is recomputed only when a download starts, so each
+    update is a time check plus, at most every PROGRESS_INTERVAL, a redraw
+    using integer arithmetic. Callers must hold _print_lock.
+    """
+    
+    def __init__(self):
+        self._sizes = {}
+        self._downloaded = {}
+        self._total = 0
+        self._inv = 0.0
+        self._last_update = 0.0
+        self.line_active = False
+    
+    def start(self, name, total_size):
+        """Register a download and its expected size (0 if unknown)."""
+        self._sizes[name] = total_size
+        self._downloaded[name] = 0
+        known = all(size > 0 for size in self._sizes.values())
+        self._total = sum(self._sizes.values()) if known else 0
+        # Tenths of a percent per byte
+        self._inv = 1000.0 / self._total if self._total > 0 else 0.0
+    
+    def update(self, name, downloaded):
+        """Record progress for a download, redrawing if the interval has passed or it completed."""
+        self._downloaded[name] = downloaded
+        now = time.monotonic()
+        if now - self._last_update < PROGRESS_INTERVAL and downloaded != self._sizes[name]:
+            return
+        self._last_update = now
+        
+        done = sum(self._downloaded.values())
+        if self._total > 0:
+            tenths = min(1000, int(done * self._inv))
+            line = "\rProgress: %d.%d%% (%d/%d bytes, %d files)" % (
+                tenths // 10, tenths % 10, done, self._total, len(self._sizes))
+        else:
+            line = "\rDownloaded: %d bytes (%d files)" % (done, len(self._sizes))
+        sys.stdout.write(line)
+        sys.stdout.flush()
+        self.line_active = True
+
+
+_progress = ProgressMeter()
+
+
+def _log(message):
+    """Print a line without interleaving it with output from other threads."""
+    with _print_lock:
+        if _progress.line_active:
+            sys.stdout.write("\n")  # Finish the progress line first
+            _progress.line_active = False
+        print(message)
+
+
+def report_progress(name, downloaded):
+    """Report bytes downloaded so far for a file started with start_progress()."""
+    with _print_lock:
+        _progress.update(name, downloaded)
+
+
+def start_progress(name, total_size):
+    """Add a file to the combined progress line."""
+    with _print_lock:
+        _progress.start(name, total_size)
+
+
+def _update_hash(sha256_hash, f):
+    """Feed the rest of an open binary file into a hash object."""
+    for byte_block in iter(lambda: f.read(1 << 20), b""):
+        sha256_hash.update(byte_block)
+
 
 def verify_file_hash(file_path, expected_hash):
-    """Verify the SHA256 hash of a downloaded file."""
+    """Verify the SHA256 hash of a file already on disk."""
     if expected_hash is None:
         return True  # Skip verification if no hash is provided
     
-    sha256_hash = hashlib.sha256()
+    import hashlib
+    
     with open(file_path, "rb") as f:
-        for byte_block in iter(lambda: f.read(4096), b""):
-            sha256_hash.update(byte_block)
+        if hasattr(hashlib, "file_digest"):
+            # Python 3.11+: hashlib drives the read loop with a reusable buffer
+            calculated_hash = hashlib.file_digest(f, "sha256").hexdigest()
+        else:
+            sha256_hash = hashlib.sha256()
+            _update_hash(sha256_hash, f)
+            calculated_hash = sha256_hash.hexdigest()
     
-    calculated_hash = sha256_hash.hexdigest()
     return calculated_hash == expected_hash
 
 
-def download_file(url, destination, expected_hash=None):
-    """Download a file from URL to destination path with progress indication and verification."""
-    print(f"Downloading {destination.name} from {url}...")
+def verify_files(items):
+    """Verify (file_path, expected_hash) pairs, returning a list of results in order.
+    
+    Hashing large files is CPU-bound, so when more than one file is large
+    each of those is checked in its own process rather than competing for
+    the GIL. Small files are hashed in-process, where they finish before a
+    worker process could even start.
+    """
+    large = [i for i, (file_path, _) in enumerate(items)
+             if os.stat(file_path).st_size >= PARALLEL_VERIFY_MIN_SIZE]
+    if len(large) < 2:
+        return [verify_file_hash(file_path, expected_hash) for file_path, expected_hash in items]
+    
+    from concurrent.futures import ProcessPoolExecutor
+    
+    results = [None] * len(items)
+    with ProcessPoolExecutor(max_workers=min(len(large), os.cpu_count() or 1)) as executor:
+        futures = {i: executor.submit(verify_file_hash, *items[i]) for i in large}
+        # Hash the small files here while the workers handle the large ones
+        for i, (file_path, expected_hash) in enumerate(items):
+            if i not in futures:
+                results[i] = verify_file_hash(file_path, expected_hash)
+        for i, future in futures.items():
+            results[i] = future.result()
+    return results
+
+
+def _partial_path(destination):
+    """Return the temporary path a file is downloaded to before being moved into place."""
+    return destination.with_name(destination.name + ".part")
+
+
+def _metadata_path(destination):
+    """Return the sidecar path holding the HTTP cache validators for a file."""
+    return destination.with_name(destination.name + ".meta")
+
+
+def load_cache_validators(destination):
+    """Build conditional request headers from a file's saved ETag/Last-Modified."""
+    import json
     
     try:
-        def report_progress(block_num, block_size, total_size):
-            """Report download progress."""
-            downloaded = block_num * block_size
-            if total_size > 0:
-                percent = min(100, downloaded * 100 / total_size)
-                sys.stdout.write(f"\rProgress: {percent:.1f}% ({downloaded}/{total_size} bytes)")
-                sys.stdout.flush()
+        with open(_metadata_path(destination)) as f:
+            metadata = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    
+    headers = {}
+    if metadata.get("etag"):
+        headers["If-None-Match"] = metadata["etag"]
+    if metadata.get("last_modified"):
+        headers["If-Modified-Since"] = metadata["last_modified"]
+    return headers
+
+
+def save_cache_validators(destination, response_headers):
+    """Remember the server's ETag/Last-Modified so later runs can send a conditional GET."""
+    import json
+    
+    metadata = {
+        "etag": response_headers.get("ETag"),
+        "last_modified": response_headers.get("Last-Modified"),
+    }
+    if any(metadata.values()):
+        with open(_metadata_path(destination), "w") as f:
+            json.dump(metadata, f)
+    else:
+        # Validators saved for an older copy don't describe this one
+        _metadata_path(destination).unlink(missing_ok=True)
+
+
+class _HashingWriter:
+    """File wrapper that hashes and reports progress for every block written."""
+    
+    def __init__(self, out_file, on_write):
+        import hashlib
+        
+        self._out_file = out_file
+        self._on_write = on_write
+        self.sha256 = hashlib.sha256()
+        self.bytes_written = 0
+    
+    def write(self, buffer):
+        _check_cancelled()
+        self._out_file.write(buffer)
+        self.sha256.update(buffer)
+        self.bytes_written += len(buffer)
+        self._on_write(self.bytes_written)
+        return len(buffer)
+
+
+def _write_body(response, file_path, offset=0):
+    """Stream a response body into file_path from offset, hashing it on the way.
+    
+    Bytes already on disk before offset are fed into the hash first, so the
+    digest always covers the whole file. Returns the _HashingWriter used.
+    """
+    import shutil
+    
+    total_size = int(response.headers.get('Content-Length', 0))
+    if total_size > 0:
+        total_size += offset
+    
+    # Large blocks keep the per-chunk syscall and interpreter
+    # overhead negligible for the ~240 MB weights file
+    with open(file_path, 'r+b' if offset else 'wb', buffering=1 << 20) as out_file:
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(out_file.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        # Hash the bytes as they arrive rather than re-reading the file
+        start_progress(file_path.name, total_size)
+        writer = _HashingWriter(out_file, lambda downloaded: report_progress(file_path.name, downloaded))
+        if offset:
+            _update_hash(writer.sha256, out_file)
+            writer.bytes_written = offset
+        # No preallocation: the file's size is what a later run resumes
+        # from, so it must only ever cover bytes actually received, even
+        # if the process is killed mid-transfer
+        shutil.copyfileobj(response, writer, 1 << 18)
+    return writer
+
+
+def find_external_downloader():
+    """Return the path to aria2c if it is installed, otherwise None.
+    
+    aria2c splits a large download over several connections, which can
+    fill a fast link that a single TCP stream cannot.
+    """
+    import shutil
+    
+    return shutil.which("aria2c")
+
+
+# Progress in aria2c's readout/summary lines, e.g. "[#2089b0 1,048,576B/248,007,048B(0%) ...]"
+# (or "1.0MiB/236MiB" when sizes are abbreviated)
+_ARIA2_PROGRESS = r"([\d,.]+)(Ki|Mi|Gi)?B/([\d,.]+)(Ki|Mi|Gi)?B\("
+_ARIA2_UNITS = {None: 1, "Ki": 1 << 10, "Mi": 1 << 20, "Gi": 1 << 30}
+
+
+def _parse_aria2_size(number, unit):
+    """Convert a size printed by aria2c to bytes."""
+    return int(float(number.replace(",", "")) * _ARIA2_UNITS[unit])
+
+
+def _save_remote_validators(url, destination):
+    """Store a file's ETag/Last-Modified from a HEAD request (best effort)."""
+    import urllib3
+    
+    _metadata_path(destination).unlink(missing_ok=True)
+    if _cancel.is_set():
+        return
+    try:
+        response = _get_pool().request("HEAD", url, timeout=30.0)
+    except urllib3.exceptions.HTTPError:
+        return
+    if response.status < 400:
+        save_cache_validators(destination, response.headers)
+
+
+def download_file_external(tool, url, destination, expected_hash=None):
+    """Download a file with aria2c into a temporary file, then move it into place.
+    
+    aria2c's progress output is fed into the shared progress line. Returns
+    True or False for a completed attempt, or None if aria2c itself failed
+    so the caller can fall back to the built-in downloader.
+    """
+    import re
+    import subprocess
+    
+    temp_path = _partial_path(destination)
+    _log(f"Downloading {destination.name} from {url} with aria2c...")
+    command = [
+        tool, "--allow-overwrite=true", "--auto-file-renaming=false",
+        "--max-connection-per-server=4", "--split=4", "--timeout=30",
+        "--summary-interval=1", "--human-readable=false",
+        "--console-log-level=warn", "--download-result=hide",
+        "--dir", str(temp_path.parent), "--out", temp_path.name, url,
+    ]
+    messages = []
+    try:
+        process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                                   text=True, errors="replace")
+    except OSError as e:
+        messages.append(str(e))
+        returncode = None
+    else:
+        with process:
+            started = False
+            for line in process.stdout:
+                if _cancel.is_set():
+                    process.terminate()
+                match = re.search(_ARIA2_PROGRESS, line)
+                if match:
+                    if not started:
+                        start_progress(temp_path.name, _parse_aria2_size(*match.group(3, 4)))
+                        started = True
+                    report_progress(temp_path.name, _parse_aria2_size(*match.group(1, 2)))
+                elif line.strip() and not line.startswith(("***", "===", "---", "FILE:")):
+                    messages.append(line.strip())
+        returncode = process.returncode
+    
+    if returncode != 0:
+        # aria2c's partial file is preallocated and written out of order, so
+        # the built-in downloader cannot resume it; start the next try clean
+        temp_path.unlink(missing_ok=True)
+        temp_path.with_name(temp_path.name + ".aria2").unlink(missing_ok=True)
+        if _cancel.is_set():
+            return False  # aria2c got the same Ctrl-C; don't fall back
+        details = messages[-1] if messages else f"exit status {returncode}"
+        _log(f"⚠ aria2c failed for {destination.name} ({details}), using the built-in downloader...")
+        return None
+    
+    _check_cancelled()
+    if not verify_file_hash(temp_path, expected_hash):
+        _log(f"✗ Hash verification failed for {destination.name}")
+        temp_path.unlink()
+        return False
+    
+    os.replace(temp_path, destination)
+    # aria2c doesn't expose the response headers; fetch them so later
+    # --force runs can still send a conditional GET
+    _save_remote_validators(url, destination)
+    _log(f"✓ Successfully downloaded {destination.name}")
+    return True
+
+
+def download_file(url, destination, expected_hash=None, validators=None, external_tool=None):
+    """Download a file from URL to destination path with progress indication and verification.
+    
+    The data is written to a .part file that only replaces destination once
+    it has been verified, so an interrupted download never looks complete.
+    A leftover .part file is continued with a Range request; if the server
+    cannot continue it or the result fails verification, the file is
+    downloaded again from scratch.
+    
+    If validators (conditional request headers) are given and the server
+    answers 304 Not Modified, the existing file is kept if it still passes
+    verification; otherwise it is fetched again unconditionally. Fresh
+    downloads without validators go through external_tool (see
+    find_external_downloader) when one is given.
+    """
+    import urllib3
+    
+    temp_path = _partial_path(destination)
+    try:
+        # Don't start anything new once the user has pressed Ctrl-C
+        _check_cancelled()
+        
+        # Leftover .part files are resumed by the built-in path below, which
+        # can recover from a bad prefix by starting over
+        if external_tool and not validators and not temp_path.exists():
+            result = download_file_external(external_tool, url, destination, expected_hash)
+            if result is not None:
+                return result
+        
+        # A conditional request starts over rather than mixing in old partial data
+        resume_from = temp_path.stat().st_size if not validators and temp_path.exists() else 0
+        if resume_from:
+            _log(f"Resuming {destination.name} at byte {resume_from} from {url}...")
+        else:
+            _log(f"Downloading {destination.name} from {url}...")
+        
+        headers = dict(validators or {})
+        if resume_from:
+            headers["Range"] = f"bytes={resume_from}-"
+        restart = False
+        complete = False
+        
+        # Stream the body through the shared pool so the connection is
+        # returned for reuse once the file has been written
+        response = _get_pool().request("GET", url, headers=headers, preload_content=False, timeout=30.0)
+        body_read = False
+        try:
+            if response.status == 304 or response.status >= 400:
+                # No body or a short error page; read it so the connection
+                # is left clean for the next request
+                response.drain_conn()
+                body_read = True
+            
+            not_modified = response.status == 304
+            partial = response.status == 206
+            content_range = response.headers.get("Content-Range", "")
+            if not_modified:
+                pass  # Checked against the local copy below
+            elif response.status == 416 and content_range == f"bytes */{resume_from}":
+                complete = True  # The .part file already holds the whole body
+            elif response.status == 416 or (partial and not content_range.startswith(f"bytes {resume_from}-")):
+                restart = True  # The server cannot continue from our offset
+            elif response.status >= 400:
+                _log(f"✗ HTTP error downloading {destination.name}: {response.status} {response.reason}")
+                return False
             else:
-                sys.stdout.write(f"\rDownloaded: {downloaded} bytes")
-                sys.stdout.flush()
-        
-        # Create an SSL context with certificate verification
-        context = ssl.create_default_context()
-        
-        # Download with timeout
-        opener = urllib.request.build_opener(urllib.request.HTTPSHandler(context=context))
-        
-        # Manually download the file using the opener to avoid global side effects
-        req = urllib.request.Request(url)
-        with opener.open(req, timeout=30) as response, open(destination, 'wb') as out_file:
-            total_size = int(response.headers.get('Content-Length', 0))
-            block_size = 8192
-            downloaded = 0
-            block_num = 0
-            while True:
-                buffer = response.read(block_size)
-                if not buffer:
-                    break
-                out_file.write(buffer)
-                downloaded += len(buffer)
-                block_num += 1
-                report_progress(block_num, block_size, total_size)
-        print()  # New line after progress
+                if not partial:
+                    resume_from = 0  # Server ignored the Range header and sent everything
+                writer = _write_body(response, temp_path, resume_from)
+                body_read = True
+                response_headers = response.headers
+        finally:
+            if not body_read:
+                # Unread (possibly large) body left on the socket; drop the
+                # connection rather than hand it back to the pool
+                response.close()
+            response.release_conn()
+        
+        if not_modified:
+            # The server's copy is unchanged, but the local one may not be
+            _check_cancelled()
+            if verify_file_hash(destination, expected_hash):
+                _log(f"✓ {destination.name} has not changed on the server, keeping existing file")
+                return True
+            _log(f"⚠ {destination.name} has not changed on the server but failed verification, downloading it again...")
+            _metadata_path(destination).unlink(missing_ok=True)
+            return download_file(url, destination, expected_hash, external_tool=external_tool)
+        
+        if complete or restart:
+            # The .part file may already be whole (e.g. a run killed after
+            # the last byte); keep it if it checks out. Without a hash only
+            # the server's size confirms that.
+            _check_cancelled()
+            if (complete or expected_hash) and verify_file_hash(temp_path, expected_hash):
+                os.replace(temp_path, destination)
+                save_cache_validators(destination, response.headers)
+                _log(f"✓ Successfully downloaded {destination.name}")
+                return True
+            _log(f"⚠ Cannot resume {destination.name}, downloading it again...")
+            temp_path.unlink()
+            return download_file(url, destination, expected_hash)
         
         # Verify hash if provided
         if expected_hash:
-            print(f"Verifying {destination.name}...")
-            if verify_file_hash(destination, expected_hash):
-                print(f"✓ Hash verification passed")
+            if writer.sha256.hexdigest() == expected_hash:
+                _log(f"✓ Hash verification passed for {destination.name}")
             else:
-                print(f"✗ Hash verification failed for {destination.name}")
-                destination.unlink()  # Delete the file
+                _log(f"✗ Hash verification failed for {destination.name}")
+                temp_path.unlink()  # Delete the file
+                if resume_from:
+                    # The bytes kept from before were bad; start over once
+                    return download_file(url, destination, expected_hash)
                 return False
         
-        print(f"✓ Successfully downloaded {destination.name}")
+        os.replace(temp_path, destination)
+        save_cache_validators(destination, response_headers)
+        _log(f"✓ Successfully downloaded {destination.name}")
         return True
-    except urllib.error.HTTPError as e:
-        print(f"\n✗ HTTP error downloading {destination.name}: {e.code} {e.reason}")
+    except DownloadCancelled:
+        return False  # The .part file is kept for the next run
+    except urllib3.exceptions.MaxRetryError as e:
+        _log(f"✗ Connection error downloading {destination.name}: {e.reason}")
         return False
-    except urllib.error.URLError as e:
-        print(f"\n✗ URL error downloading {destination.name}: {e.reason}")
+    except urllib3.exceptions.HTTPError as e:
+        _log(f"✗ HTTP error downloading {destination.name}: {e}")
         return False
     except OSError as e:
-        print(f"\n✗ OS error downloading {destination.name}: {e}")
+        _log(f"✗ OS error downloading {destination.name}: {e}")
         return False
     except Exception as e:
-        print(f"\n✗ Unexpected error downloading {destination.name}: {e}")
+        _log(f"✗ Unexpected error downloading {destination.name}: {e}")
         return False
 
 
+def download_group(jobs):
+    """Download files from the same host one after another.
+    
+    Keeping same-host files on one worker lets them share a single
+    keep-alive connection from the pool rather than each thread opening
+    its own, which saves a TCP + TLS handshake per extra file.
+    """
+    return [download_file(*job) for job in jobs if not _cancel.is_set()]
+
+
 def main():
     """Main function to download all YOLO files."""
     # Parse command line arguments
     parser = argparse.ArgumentParser(description='Download YOLO configuration and weights files.')
     parser.add_argument('--force', action='store_true', 
-                       help='Force re-download even if files already exist')
+                       help='Re-download existing files unless the server reports them '
+                            'unchanged and they pass hash verification')
+    parser.add_argument('--no-external', action='store_true',
+                       help='Do not use aria2c even if it is installed')
     args = parser.parse_args()
     
     print("=" * 60)
@@ -142,36 +645,70 @@ def main():
     
     success_count = 0
     total_files = len(YOLO_FILES)
+    pending = {}  # host -> list of download_file() arguments
     
-    # Download each file
+    # Verify all existing files up front so the hashing can run in parallel
+    to_verify = {}
+    for filename, file_info in YOLO_FILES.items():
+        destination = YOLO_DIR / filename
+        if destination.exists() and not args.force and file_info.get("sha256"):
+            print(f"Verifying existing {filename}...")
+            to_verify[filename] = (destination, file_info["sha256"])
+    verified = dict(zip(to_verify, verify_files(list(to_verify.values()))))
+    
+    # Check which files still need to be downloaded
     for filename, file_info in YOLO_FILES.items():
         destination = YOLO_DIR / filename
         url = file_info["url"]
         expected_hash = file_info.get("sha256")
+        validators = None
         
         # Check if file already exists
         if destination.exists() and not args.force:
             # Verify existing file if hash is provided
             if expected_hash:
-                print(f"Verifying existing {filename}...")
-                if verify_file_hash(destination, expected_hash):
+                if verified[filename]:
                     print(f"✓ {filename} already exists and is valid, skipping...")
                     success_count += 1
                     continue
                 else:
                     print(f"⚠ {filename} exists but hash verification failed, re-downloading...")
                     destination.unlink()
+                    _metadata_path(destination).unlink(missing_ok=True)
             else:
                 print(f"✓ {filename} already exists, skipping...")
                 success_count += 1
                 continue
         elif destination.exists() and args.force:
-            print(f"⚠ {filename} exists but --force flag set, re-downloading...")
-            destination.unlink()
+            # Ask the server to skip the transfer if the file has not changed
+            print(f"⚠ {filename} exists but --force flag set, re-downloading if changed...")
+            validators = load_cache_validators(destination)
+        
+        external_tool = None
+        if file_info.get("external") and not args.no_external:
+            external_tool = find_external_downloader()
         
-        # Download the file
-        if download_file(url, destination, expected_hash):
-            success_count += 1
+        pending.setdefault(urlparse(url).hostname, []).append(
+            (url, destination, expected_hash, validators, external_tool))
+    
+    # Download the remaining files concurrently, one worker per host; the
+    # work is network-bound, so the threads mostly wait on sockets
+    if pending:
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+        
+        print()
+        executor = ThreadPoolExecutor(max_workers=min(len(pending), MAX_DOWNLOAD_WORKERS))
+        try:
+            futures = [executor.submit(download_group, jobs) for jobs in pending.values()]
+            for future in as_completed(futures):
+                success_count += sum(future.result())
+        except KeyboardInterrupt:
+            # Don't wait for running transfers; they stop at their next block
+            _cancel.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+            _log("✗ Interrupted; partial downloads are kept and will resume on the next run")
+            return 130
+        executor.shutdown()
         print()
     
     # Print summary